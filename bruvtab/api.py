@@ -21,6 +21,7 @@ from bruvtab.inout import MultiPartForm
 from bruvtab.inout import edit_tabs_in_editor
 from bruvtab.operations import infer_all_commands
 from bruvtab.parallel import call_parallel
+from bruvtab.parallel import iter_parallel
 from bruvtab.tab import parse_tab_lines
 from bruvtab.utils import encode_query
 from bruvtab.wait import ConditionTrue
@@ -39,18 +40,21 @@ class HttpClient:
         self._timeout: float = timeout
 
     def get(self, path, data=None):
+        return self.get_bytes(path, data).decode('utf8')
+
+    def get_bytes(self, path, data=None):
         url = 'http://%s:%s%s' % (self._host, self._port, path)
-        logger.info('GET %s' % url)
+        logger.info('GET %s', url)
         if data is not None:
             data = data.encode('utf8')
         request = Request(url=url, data=data, method='GET')
 
         with urlopen(request, timeout=self._timeout) as response:
-            return response.read().decode('utf8')
+            return response.read()
 
     def post(self, path, files=None):
         url = 'http://%s:%s%s' % (self._host, self._port, path)
-        logger.info('POST %s' % url)
+        logger.info('POST %s', url)
         form = MultiPartForm()
         for filename, content in files.items():
             form.add_file(filename, filename,
@@ -211,21 +215,30 @@ class SingleMediatorAPI(object):
         return tabs
 
     def list_tabs(self, args):
+        # Decoded from list_tabs_bytes so that both split lines the same way:
+        # bytes.splitlines only breaks on \n and \r, not on the other line
+        # boundaries str.splitlines knows about (\x0c, \u2028, ...) that
+        # may appear in tab titles.
+        return [line.decode('utf8') for line in self.list_tabs_bytes(args)]
+
+    def list_tabs_bytes(self, args):
+        """
+        Same as list_tabs, but return utf-8 encoded lines exactly as they are
+        received, for callers that only write them out.
+        """
         num_tabs = MAX_NUMBER_OF_TABS
         if len(args) > 0:
             num_tabs = int(args[0])
 
-        result = self._get('/list_tabs')
-        lines = []
-        for line in result.splitlines()[:num_tabs]:
-            lines.append(line)
-        return self.prefix_tabs(lines)
+        prefix = self._prefix.encode('utf8')
+        result = self._client.get_bytes('/list_tabs')
+        return [prefix + line for line in result.splitlines()[:num_tabs]]
 
-    def list_tabs_safe(self, args, print_error=False):
+    def list_tabs_safe(self, args, print_error=False, as_bytes=False):
         args = args or []
         tabs = []
         try:
-            tabs = self.list_tabs(args)
+            tabs = self.list_tabs_bytes(args) if as_bytes else self.list_tabs(args)
         except ValueError as e:
             print("Cannot decode JSON: %s: %s" % (self, e), file=sys.stderr)
             if print_error:
@@ -245,7 +258,9 @@ class SingleMediatorAPI(object):
 
     def open_urls(self, urls, window_id=None):
         data = '\n'.join(urls)
-        logger.info('SingleMediatorAPI: open_urls: %s', urls)
+        logger.info('SingleMediatorAPI: open_urls: %s URLs', len(urls))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug('SingleMediatorAPI: open_urls: %s', urls)
         files = {'urls': data}
         ids = self._post('/open_urls'
                          if window_id is None
@@ -362,20 +377,31 @@ class MultipleMediatorsAPI(object):
     def ready_apis(self):
         return [api for api in self._apis if api.ready]
 
+    def _call_apis(self, apis, method, *args):
+        """
+        Call the same method on every given API concurrently. Results are
+        returned in the order of apis.
+        """
+        functions = [partial(getattr(api, method), *args) for api in apis]
+        if not functions:
+            return []
+        return call_parallel(functions)
+
     def close_tabs(self, args):
-        for api in self._apis:
-            api.close_tabs(args)
+        self._call_apis(self._apis, 'close_tabs', args)
 
     def activate_tab(self, args: List[str], focused: bool):
         if len(args) == 0:
             print('Usage: bruvtab_client.py activate_tab [--focused] <#tab>')
             return 2
 
+        # Kept sequential: a single tab is activated, and with --focused the
+        # last client must be the one that ends up on top.
         for api in self._apis:
             api.activate_tab(args, focused)
 
     def get_active_tabs(self, args):
-        return [api.get_active_tabs(args) for api in self._apis]
+        return self._call_apis(self._apis, 'get_active_tabs', args)
 
     def query_tabs(self, args, print_error=False):
         functions = [partial(api.query_tabs_safe, args, print_error)
@@ -385,14 +411,17 @@ class MultipleMediatorsAPI(object):
         tabs = sum(call_parallel(functions), [])
         return tabs
 
-    def list_tabs(self, args, print_error=False):
-        functions = [partial(api.list_tabs_safe, args, print_error)
+    def list_tabs(self, args, print_error=False, as_bytes=False):
+        functions = [partial(api.list_tabs_safe, args, print_error, as_bytes)
                      for api in self.ready_apis]
         if not functions:
             return []
         tabs = sum(call_parallel(functions), [])
         return tabs
 
+    def list_tabs_bytes(self, args, print_error=False):
+        return self.list_tabs(args, print_error, as_bytes=True)
+
     def _move_tabs_if_changed(self, api, tabs_before, tabs_after):
         delete_commands, move_commands, update_commands = infer_all_commands(
             parse_tab_lines(tabs_before),
@@ -411,13 +440,15 @@ class MultipleMediatorsAPI(object):
             api.update_tabs(update_commands)
 
     def update_tabs(self, all_updates):
-        results = []
+        functions = []
         for api in self._apis:
             updates = [deepcopy(u) for u in all_updates if api.prefix_match(u['tab_id'])]
             for u in updates:
                 u['tab_id'] = int_tab_id(u['tab_id'])
-            results.extend(api.update_tabs(updates))
-        return results
+            functions.append(partial(api.update_tabs, updates))
+        if not functions:
+            return []
+        return sum(call_parallel(functions), [])
 
     def move_tabs(self, args):
         """
@@ -465,12 +496,9 @@ class MultipleMediatorsAPI(object):
 
     def get_words(self, tab_ids, match_regex, join_with):
         words = set()
-        import time
-        for api in self.ready_apis:
-            start = time.time()
-            words |= set(api.get_words(tab_ids, match_regex, join_with))
-            delta = time.time() - start
-            # print('DELTA', delta, file=sys.stderr)
+        for api_words in self._call_apis(self.ready_apis, 'get_words',
+                                         tab_ids, match_regex, join_with):
+            words |= set(api_words)
         return sorted(list(words))
 
     def _get_text_or_html(self, api, getter, args, delimiter_regex, replace_with):
@@ -491,16 +519,29 @@ class MultipleMediatorsAPI(object):
             logger.error("Unknown exception: %s %s" % (api, e))
         return result
 
+    def _text_or_html_functions(self, method, args, delimiter_regex, replace_with):
+        return [partial(self._get_text_or_html, api, getattr(api, method), args,
+                        delimiter_regex, replace_with)
+                for api in self.ready_apis]
+
     def get_text(self, args, delimiter_regex, replace_with):
-        tabs = []
-        for api in self.ready_apis:
-            tabs.extend(self._get_text_or_html(api, api.get_text, args,
-                                               delimiter_regex, replace_with))
-        return tabs
+        return list(self.iter_text(args, delimiter_regex, replace_with))
 
     def get_html(self, args, delimiter_regex, replace_with):
-        tabs = []
-        for api in self.ready_apis:
-            tabs.extend(self._get_text_or_html(api, api.get_html, args,
-                                               delimiter_regex, replace_with))
-        return tabs
+        return list(self.iter_html(args, delimiter_regex, replace_with))
+
+    def iter_text(self, args, delimiter_regex, replace_with, ordered=True):
+        """
+        Yield text lines of every client as soon as that client responds.
+        With ordered=True lines stay in client order, otherwise slow
+        browsers do not hold back the output of the fast ones.
+        """
+        functions = self._text_or_html_functions('get_text', args, delimiter_regex, replace_with)
+        for tabs in iter_parallel(functions, ordered):
+            yield from tabs
+
+    def iter_html(self, args, delimiter_regex, replace_with, ordered=True):
+        """Same as iter_text, but for html."""
+        functions = self._text_or_html_functions('get_html', args, delimiter_regex, replace_with)
+        for tabs in iter_parallel(functions, ordered):
+            yield from tabs
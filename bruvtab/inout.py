@@ -1,8 +1,11 @@
+import errno
 import io
 import mimetypes
 import os
+import selectors
 import socket
 import sys
+import time
 import uuid
 from select import select
 from subprocess import CalledProcessError
@@ -36,6 +39,43 @@ def is_port_accepting_connections(port, host='127.0.0.1'):
     return result == 0
 
 
+def are_ports_accepting_connections(addresses, timeout=0.100):
+    """
+    Check several (host, port) addresses at once: start non-blocking connects
+    to all of them and wait for the results with a single selector, so the
+    whole check takes at most timeout seconds.
+
+    Return a list of booleans in the order of addresses.
+    """
+    result = [False] * len(addresses)
+    sockets = []
+    with selectors.DefaultSelector() as selector:
+        try:
+            for index, (host, port) in enumerate(addresses):
+                s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                sockets.append(s)
+                s.setblocking(False)
+                error = s.connect_ex((host, port))
+                if error == 0:
+                    result[index] = True
+                elif error in (errno.EINPROGRESS, errno.EWOULDBLOCK):
+                    selector.register(s, selectors.EVENT_WRITE, index)
+
+            deadline = time.monotonic() + timeout
+            while selector.get_map():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                for key, _events in selector.select(remaining):
+                    error = key.fileobj.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+                    result[key.data] = error == 0
+                    selector.unregister(key.fileobj)
+        finally:
+            for s in sockets:
+                s.close()
+    return result
+
+
 def save_tabs_to_file(tabs, filename):
     with open(filename, 'w', encoding='utf-8') as file_:
         file_.write('\n'.join(tabs))
@@ -76,7 +116,7 @@ def read_stdin(timeout=1.0):
 
 
 def read_stdin_lines():
-    return [line.strip() for line in sys.stdin.readlines()]
+    return [line.strip() for line in sys.stdin]
 
 
 def marshal(obj):
@@ -92,6 +132,24 @@ def stdout_buffer_write(message):
     return sys.stdout.buffer.write(message)
 
 
+def write_lines(lines, flush_size=None):
+    """
+    Write lines to stdout, each followed by a newline, without building the
+    joined str first. Lines are str (encoded to utf-8) or already encoded
+    bytes. Output is collected in a single buffer, or written out every
+    flush_size bytes when it is given.
+    """
+    buffer = bytearray()
+    for line in lines:
+        buffer += line if isinstance(line, bytes) else line.encode('utf-8')
+        buffer += b'\n'
+        if flush_size is not None and len(buffer) >= flush_size:
+            stdout_buffer_write(bytes(buffer))
+            buffer.clear()
+    if buffer:
+        stdout_buffer_write(buffer)
+
+
 # Taken from https://pymotw.com/3/urllib.request/
 class MultiPartForm:
     """Accumulate the data to be used when posting a form."""
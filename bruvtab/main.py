@@ -49,25 +49,21 @@ News:
 """
 
 import json
+import logging
 import os
 import re
 import sys
 import time
 import argcomplete
 from base64 import b64decode
-from argparse import ArgumentParser, SUPPRESS
-from importlib import resources
+from argparse import ArgumentParser, Namespace, SUPPRESS
 from functools import partial
-from itertools import groupby
 from json import loads, dumps
 from string import ascii_lowercase
 from typing import List
 from typing import Tuple
 from urllib.parse import quote_plus
 
-from rich.json import JSON
-from rich import box
-from rich.table import Table
 from rich.console import Console
 from rich_argparse import RichHelpFormatter
 
@@ -80,12 +76,13 @@ from bruvtab.const import DEFAULT_GET_TEXT_REPLACE_WITH
 from bruvtab.const import DEFAULT_GET_WORDS_JOIN_WITH
 from bruvtab.const import DEFAULT_GET_WORDS_MATCH_REGEX
 from bruvtab.files import in_temp_dir
+from bruvtab.inout import are_ports_accepting_connections
 from bruvtab.inout import get_mediator_ports
-from bruvtab.inout import is_port_accepting_connections
 from bruvtab.inout import marshal
 from bruvtab.inout import read_stdin
 from bruvtab.inout import read_stdin_lines
 from bruvtab.inout import stdout_buffer_write
+from bruvtab.inout import write_lines
 from bruvtab.mediator.log import bruvtab_logger
 from bruvtab.operations import make_update
 from bruvtab.platform import is_windows
@@ -93,8 +90,6 @@ from bruvtab.platform import make_windows_path_double_sep
 from bruvtab.platform import register_native_manifest_windows_brave
 from bruvtab.platform import register_native_manifest_windows_chrome
 from bruvtab.platform import register_native_manifest_windows_firefox
-from bruvtab.search.index import index
-from bruvtab.search.query import query
 from bruvtab.ui import print_error
 from bruvtab.ui import print_info
 from bruvtab.ui import stdout_console
@@ -104,6 +99,11 @@ from bruvtab.utils import split_tab_ids
 from bruvtab.utils import which
 
 
+STDOUT_FLUSH_SIZE = 64 * 1024
+TSV_BUFFER_SIZE = 1024 * 1024
+PREFIX_WINDOW_ID_RE = re.compile(r'[A-Za-z](?:\.(?:\d+)?)?')
+TAB_ID_RE = re.compile(r'[A-Za-z]\.\d+\.\d+')
+
 RichHelpFormatter.styles.update({
     'argparse.args': 'bold cyan',
     'argparse.groups': 'bold dark_orange',
@@ -164,17 +164,42 @@ def _client_matches_selector(client, selector):
     return selector in browser
 
 
-def create_clients(target_hosts=None, client_selector=None) -> List[SingleMediatorAPI]:
+# Clients created during the current command, keyed by (pid, target_hosts).
+# Client selectors are applied on top, so e.g. completing clients and windows
+# with different selectors probes the mediators only once. The cache is reset
+# by run_commands, so a long-lived process never sees mediators that have
+# gone away since the previous command.
+_clients_cache = {}
+
+
+def reset_clients_cache():
+    _clients_cache.clear()
+
+
+def _create_all_clients(target_hosts) -> List[SingleMediatorAPI]:
+    key = (os.getpid(), target_hosts)
+    if key in _clients_cache:
+        return _clients_cache[key]
+
     if target_hosts is None:
         ports = list(get_mediator_ports())
         hosts = ['localhost'] * len(ports)
     else:
         hosts, ports = parse_target_hosts(target_hosts)
 
+    # Probe all ports at once, so closed ports cost one connect timeout in
+    # total instead of one each.
+    accepting = are_ports_accepting_connections(list(zip(hosts, ports)))
     clients = [SingleMediatorAPI(prefix, host=host, port=port)
-               for prefix, host, port in zip(ascii_lowercase, hosts, ports)
-               if is_port_accepting_connections(port, host)]
-    result = [client for client in clients
+               for prefix, host, port, is_accepting
+               in zip(ascii_lowercase, hosts, ports, accepting)
+               if is_accepting]
+    _clients_cache[key] = clients
+    return clients
+
+
+def create_clients(target_hosts=None, client_selector=None) -> List[SingleMediatorAPI]:
+    result = [client for client in _create_all_clients(target_hosts)
               if _client_matches_selector(client, client_selector)]
     bruvtab_logger.info('Created clients: %s', result)
     return result
@@ -198,7 +223,7 @@ def parse_prefix_and_window_id(prefix_window_id):
 
 
 def is_prefix_window_id(value):
-    return re.fullmatch(r'[A-Za-z](?:\.(?:\d+)?)?', value) is not None
+    return PREFIX_WINDOW_ID_RE.fullmatch(value) is not None
 
 
 def parse_open_arguments(values):
@@ -222,7 +247,7 @@ def filter_apis_by_tab_id(apis, tab_id):
 
 
 def is_tab_id(value):
-    return re.fullmatch(r'[A-Za-z]\.\d+\.\d+', value) is not None
+    return TAB_ID_RE.fullmatch(value) is not None
 
 
 def tab_id_from_line(line):
@@ -373,12 +398,14 @@ def completion_validator(candidate, current_input):
 
 def print_json(data):
     if stdout_supports_rich():
+        from rich.json import JSON
         stdout_console.print(JSON.from_data(data))
     else:
         print(json.dumps(data, indent=2))
 
 
 def print_table(columns, rows, right_aligned_columns=None, no_wrap=False):
+    from rich.table import Table
     right_aligned_columns = set() if right_aligned_columns is None else set(right_aligned_columns)
     table = Table(box=None, padding=(0, 1, 0, 0), show_header=True, show_edge=False, show_lines=False)
     styles = ["cyan", "green", "blue", "magenta", "yellow", "red"]
@@ -404,14 +431,23 @@ def move_tabs(args):
 
 def list_tabs(args):
     """
-    Use this to show duplicates:
-        bruvtab list | sort -k3 | uniq -f2 -D | cut -f1 | bruvtab close
+    Use this to close duplicates:
+        bruvtab dup --close
     """
     bruvtab_logger.info('Listing tabs')
     api = MultipleMediatorsAPI(create_clients_from_args(args))
+    if not args.selectors and not args.json and not stdout_supports_rich():
+        # Plain output is written as received, without decoding and
+        # encoding it again
+        write_lines(api.list_tabs_bytes([]))
+        return
     tabs = api.list_tabs([])
     for selector in args.selectors:
         tabs = [tab for tab in tabs if tab_matches_selector(tab, selector)]
+    _print_tabs(tabs, args)
+
+
+def _print_tabs(tabs, args):
     if args.json:
         tabs_json = [
             {"id": x[0], "title": x[1], "url": x[2]}
@@ -422,8 +458,7 @@ def list_tabs(args):
         rows = [tab.split('\t', 2) for tab in tabs]
         print_table(['ID', 'Title', 'URL'], rows, no_wrap=args.no_wrap)
     else:
-        message = "\n".join(tabs) + "\n"
-        sys.stdout.buffer.write(message.encode("utf8"))
+        write_lines(tabs)
 
 
 def close_tabs(args):
@@ -432,7 +467,9 @@ def close_tabs(args):
     if len(args.tab_ids) == 0:
         tab_ids = split_tab_ids(read_stdin().strip())
 
-    bruvtab_logger.info('Closing tabs: %s', tab_ids)
+    bruvtab_logger.info('Closing %s tabs', len(tab_ids))
+    if bruvtab_logger.isEnabledFor(logging.DEBUG):
+        bruvtab_logger.debug('Closing tabs: %s', tab_ids)
     api = MultipleMediatorsAPI(create_clients_from_args(args))
     tabs = api.close_tabs(tab_ids)
 
@@ -447,8 +484,7 @@ def show_active_tabs(args):
     bruvtab_logger.info('Showing active tabs: %s', args)
     apis = create_clients_from_args(args)
     active_tabs = []
-    for api in apis:
-        tabs = api.get_active_tabs(args)
+    for api, tabs in zip(apis, MultipleMediatorsAPI(apis).get_active_tabs(args)):
         for tab in tabs:
             active_tabs.append({"id": tab, "client": str(api)})
 
@@ -458,8 +494,7 @@ def show_active_tabs(args):
         print_table(['ID', 'Client'], [[tab['id'], tab['client']] for tab in active_tabs],
                     no_wrap=args.no_wrap)
     else:
-        for tab in active_tabs:
-            print('%s\t%s' % (tab['id'], tab['client']))
+        write_lines('%s\t%s' % (tab['id'], tab['client']) for tab in active_tabs)
 
 
 def screenshot(args):
@@ -496,6 +531,8 @@ def screenshot(args):
 
 
 def search_tabs(args):
+    # sqlite and search helpers are only needed by search/index commands
+    from bruvtab.search.query import query
     for result in query(args.sqlite, args.query):
         print('\t'.join([result.tab_id, result.title, result.snippet]))
 
@@ -514,20 +551,23 @@ def query_tabs(args):
 
 
 def index_tabs(args):
+    from bruvtab.search.index import index
+    from bruvtab.search.index import index_rows
+    start = time.time()
     if args.tsv is None:
-        args.tsv = in_temp_dir('tabs.tsv')
+        # Text is inserted into sqlite as it arrives from the browsers,
+        # without going through an intermediate tsv file
+        bruvtab_logger.info('index_tabs: retrieving tabs from browser into %s', args.sqlite)
         args.cleanup = True
-        bruvtab_logger.info(
-            'index_tabs: retrieving tabs from browser into file %s', args.tsv)
-        start = time.time()
-        get_text(args)
-        delta = time.time() - start
-        bruvtab_logger.info('getting text took %s', delta)
-
-    start = time.time()
-    index(args.sqlite, args.tsv)
+        # Row order does not matter to the index, take clients as they come
+        tabs = iter_text_or_html(args, 'iter_text', ordered=False)
+        if tabs is None:
+            return 1
+        index_rows(args.sqlite, (tuple(line.split('\t', 3)) for line in tabs))
+    else:
+        index(args.sqlite, args.tsv)
     delta = time.time() - start
-    bruvtab_logger.info('sqlite create took %s, size %s',
+    bruvtab_logger.info('getting text and sqlite create took %s, size %s',
                        delta, get_file_size(args.sqlite))
 
 
@@ -552,8 +592,10 @@ def open_urls(args):
     prefix, window_id, urls = parse_open_arguments(args.open_args)
     if not urls:
         urls = read_stdin_lines()
-    bruvtab_logger.info('Opening URLs, prefix "%s", window_id "%s": %s',
-                       prefix, window_id, urls)
+    bruvtab_logger.info('Opening %s URLs, prefix "%s", window_id "%s"',
+                       len(urls), prefix, window_id)
+    if bruvtab_logger.isEnabledFor(logging.DEBUG):
+        bruvtab_logger.debug('Opening URLs: %s', urls)
     api = MultipleMediatorsAPI(create_clients_from_args(args))
     ids = api.open_urls(urls, prefix, window_id)
     stdout_buffer_write(marshal(ids))
@@ -602,92 +644,126 @@ def get_words(args):
     # [...new Set(document.body.innerText.match(/\w+/g))].sort().join('\n');
     # "})
     start = time.time()
-    bruvtab_logger.info('Get words from tabs: %s, match_regex=%s, join_with=%s',
-                       args.tab_ids, args.match_regex, args.join_with)
+    bruvtab_logger.info('Get words from %s tabs, match_regex=%s, join_with=%s',
+                       len(args.tab_ids), args.match_regex, args.join_with)
+    if bruvtab_logger.isEnabledFor(logging.DEBUG):
+        bruvtab_logger.debug('Get words from tabs: %s', args.tab_ids)
     apis = create_clients_from_args(args)
     tab_ids = resolve_tab_selectors(apis, args.tab_ids) if args.tab_ids else []
     if tab_ids is None:
         return 1
     api = MultipleMediatorsAPI(apis)
     words = api.get_words(tab_ids, args.match_regex, args.join_with)
-    print('\n'.join(words))
+    write_lines(words)
     delta = time.time() - start
     # print('DELTA TOTAL', delta, file=sys.stderr)
 
 
-def get_text_or_html(getter, args):
-    tabs = getter(args.resolved_tab_ids, args.delimiter_regex, args.replace_with)
+def _cleanup_tab_line(line):
+    # Only the text (the last column) is cleaned up, so slice it off instead
+    # of splitting and joining all the columns. str.split() collapses runs of
+    # whitespace much faster than re.sub.
+    text_start = line.rfind('\t') + 1
+    return line[:text_start] + ' '.join(line[text_start:].split())
+
 
+def iter_text_or_html(args, method, ordered=True):
+    """
+    Yield text/html lines of the tabs selected by args as soon as each
+    client responds, cleaned up if requested. Lines stay in client order
+    unless ordered is False. Return None if a tab selector does not match
+    any tab.
+    """
+    apis = create_clients_from_args(args)
+    tab_ids = resolve_tab_selectors(apis, args.tab_ids) if args.tab_ids else []
+    if tab_ids is None:
+        return None
+    getter = getattr(MultipleMediatorsAPI(apis), method)
+    tabs = getter(tab_ids, args.delimiter_regex, args.replace_with, ordered)
     if args.cleanup:
-        pattern = re.compile(r'\s+')
-        old_tabs = tabs
-        tabs = []
-        for line in old_tabs:
-            tab_id, title, url, text = line.split('\t')
-            text = re.sub(pattern, ' ', text)
-            tabs.append('\t'.join([tab_id, title, url, text]))
-
-    message = '\n'.join(tabs) + '\n'
-    if args.tsv is None:
-        stdout_buffer_write(message.encode('utf8'))
+        tabs = map(_cleanup_tab_line, tabs)
+    return tabs
+
+
+def write_text_or_html(tabs, tsv):
+    # lines are written out one by one instead of joining them first
+    if tsv is None:
+        write_lines(tabs, STDOUT_FLUSH_SIZE)
     else:
-        with open(args.tsv, 'w', encoding='utf-8') as file_:
-            file_.write(message)
+        with open(tsv, 'w', encoding='utf-8', buffering=TSV_BUFFER_SIZE) as file_:
+            for line in tabs:
+                file_.write(line)
+                file_.write('\n')
 
 
 def get_text(args):
     bruvtab_logger.info('Get text from tabs')
-    apis = create_clients_from_args(args)
-    args.resolved_tab_ids = resolve_tab_selectors(apis, args.tab_ids) if args.tab_ids else []
-    if args.resolved_tab_ids is None:
+    tabs = iter_text_or_html(args, 'iter_text')
+    if tabs is None:
         return 1
-    api = MultipleMediatorsAPI(apis)
-    return get_text_or_html(api.get_text, args)
+    write_text_or_html(tabs, args.tsv)
 
 
 def get_html(args):
     bruvtab_logger.info('Get html from tabs')
-    apis = create_clients_from_args(args)
-    args.resolved_tab_ids = resolve_tab_selectors(apis, args.tab_ids) if args.tab_ids else []
-    if args.resolved_tab_ids is None:
+    tabs = iter_text_or_html(args, 'iter_html')
+    if tabs is None:
         return 1
-    api = MultipleMediatorsAPI(apis)
-    return get_text_or_html(api.get_html, args)
+    write_text_or_html(tabs, args.tsv)
 
 
-def show_duplicates(args):
-    # I'm not using uniq here because it's not easy to get duplicates
-    # only by a single column. awk is much easier in this regard.
-    # print('bruvtab list | sort -k3 | uniq -f2 -D | cut -f1 | bruvtab close')
-    title_command = "bruvtab list | sort -k2 | awk -F$'\\t' '{ if (a[$2]++ > 0) print }' | cut -f1 | bruvtab close"
-    url_command = "bruvtab list | sort -k3 | awk -F$'\\t' '{ if (a[$3]++ > 0) print }' | cut -f1 | bruvtab close"
+DUPLICATE_KEY_COLUMNS = {'title': 1, 'url': 2}
+# Shared by the dup subparser and its FAST_COMMANDS entry
+DUPLICATE_DEFAULTS = {'by': 'url', 'close': False}
 
-    if stdout_supports_rich():
-        stdout_console.print('Close duplicates by Title:', style='bold cyan')
-        stdout_console.print(title_command, style='green')
-        stdout_console.print()
-        stdout_console.print('Close duplicates by URL:', style='bold cyan')
-        stdout_console.print(url_command, style='green')
-        return
 
-    print("Close duplicates by Title:")
-    print(title_command)
-    print("")
-    print("Close duplicates by URL:")
-    print(url_command)
+def find_duplicate_tabs(tabs, key=DUPLICATE_DEFAULTS['by']):
+    """
+    Return every tab whose title or URL (depending on key) has already been
+    seen in one of the preceding tabs, i.e. all copies except the first one.
+    """
+    column = DUPLICATE_KEY_COLUMNS[key]
+    seen = set()
+    duplicates = []
+    for tab in tabs:
+        parts = tab.split('\t')
+        if len(parts) <= column:
+            continue
+        value = parts[column]
+        if value in seen:
+            duplicates.append(tab)
+        else:
+            seen.add(value)
+    return duplicates
+
+
+def show_duplicates(args):
+    bruvtab_logger.info('Showing duplicates by %s', args.by)
+    api = MultipleMediatorsAPI(create_clients_from_args(args))
+    duplicates = find_duplicate_tabs(api.list_tabs([]), args.by)
+    if args.close:
+        tab_ids = [tab_id_from_line(tab) for tab in duplicates]
+        bruvtab_logger.info('Closing %s duplicate tabs', len(tab_ids))
+        if bruvtab_logger.isEnabledFor(logging.DEBUG):
+            bruvtab_logger.debug('Closing duplicate tabs: %s', tab_ids)
+        if tab_ids:
+            api.close_tabs(tab_ids)
+        return
+    _print_tabs(duplicates, args)
 
 
 def _get_window_id(tab):
-    ids, _title, _url = tab.split('\t')
-    client_id, window_id, tab_id = ids.split('.')
-    return '%s.%s' % (client_id, window_id)
+    # <prefix>.<window_id>.<tab_id><Tab>... -> <prefix>.<window_id>
+    ids = tab.partition('\t')[0]
+    return ids[:ids.rfind('.')]
 
 
 def _print_available_windows(tabs, as_json=False, no_wrap=False):
-    windows = []
-    for key, group in groupby(sorted(tabs), _get_window_id):
-        group = list(group)
-        windows.append((key, len(group)))
+    counts = {}
+    for tab in tabs:
+        key = _get_window_id(tab)
+        counts[key] = counts.get(key, 0) + 1
+    windows = sorted(counts.items())
 
     if as_json:
         print_json([{"window": key, "tabs": count} for key, count in windows])
@@ -744,6 +820,7 @@ def show_clients(args):
 
 
 def install_mediator(args):
+    from importlib import resources
     bruvtab_logger.info('Installing mediators')
     mediator_path = which('bruvtab_mediator')
     if is_windows():
@@ -786,10 +863,15 @@ def install_mediator(args):
             tests_targets = [(s, d) for (s, d) in tests_targets if browser_token in d]
         native_app_manifests.extend(tests_targets)
 
+    # Several destinations share the same template, render each one once
+    manifests = {}
+    for filename in dict.fromkeys(filename for filename, _destination in native_app_manifests):
+        template = resources.files('bruvtab').joinpath(filename).read_text(encoding='utf8')
+        manifests[filename] = template.replace(r'$PWD/bruvtab_mediator.py', mediator_path)
+
     for filename, destination in native_app_manifests:
         destination = os.path.expanduser(os.path.expandvars(destination))
-        template = resources.files('bruvtab').joinpath(filename).read_text(encoding='utf8')
-        manifest = template.replace(r'$PWD/bruvtab_mediator.py', mediator_path)
+        manifest = manifests[filename]
         bruvtab_logger.info('Installing template %s into %s', filename, destination)
         print_info('Installing mediator manifest %s' % destination)
 
@@ -883,18 +965,7 @@ def add_global_arguments(parser, default=None):
     return parser_client
 
 
-def build_parser():
-    parser = ArgumentParser(
-        formatter_class=make_help_formatter,
-        description='bruvtab (bruvtab = Browser Tabs) is a command-line tool that helps you manage '
-                    'browser tabs. It can help you list, close, reorder, open and activate '
-                    'your tabs.')
-
-    parser_client = add_global_arguments(parser)
-
-    subparsers = parser.add_subparsers(dest='command')
-    parser.set_defaults(func=partial(no_command, parser))
-
+def _add_move_tabs_parser(subparsers):
     parser_move_tabs = subparsers.add_parser(
         'move',
         help='Move tabs around. This command lists available tabs and runs '
@@ -903,7 +974,10 @@ def build_parser():
              '3) change window ID of the tabs -- tabs will be moved to '
              'specified windows')
     parser_move_tabs.set_defaults(func=move_tabs)
+    return parser_move_tabs
 
+
+def _add_list_tabs_parser(subparsers):
     parser_list_tabs = subparsers.add_parser(
         'list',
         aliases=['tabs'],
@@ -914,7 +988,10 @@ def build_parser():
     parser_list_tabs.set_defaults(func=list_tabs)
     parser_list_tabs.add_argument('selectors', type=str, nargs='*',
                                   help='Optional title or URL fragments to match')
+    return parser_list_tabs
+
 
+def _add_close_tabs_parser(subparsers):
     parser_close_tabs = subparsers.add_parser(
         'close',
         help='Close specified tab IDs. Tab IDs should be in the following format: '
@@ -923,7 +1000,11 @@ def build_parser():
     parser_close_tabs.set_defaults(func=close_tabs)
     parser_close_tabs_ids = parser_close_tabs.add_argument('tab_ids', type=str, nargs='*',
                                                            help='Tab IDs to close')
+    parser_close_tabs_ids.completer = complete_tab_ids
+    return parser_close_tabs
+
 
+def _add_activate_tab_parser(subparsers):
     parser_activate_tab = subparsers.add_parser(
         'activate',
         help='Activate given tab ID. Tab ID should be in the following format: '
@@ -933,13 +1014,20 @@ def build_parser():
                                                               help='Tab ID to activate')
     parser_activate_tab.add_argument('--focused', action='store_const', const=True, default=None,
                                      help='make browser focused after tab activation (default: False)')
+    parser_activate_tab_id.completer = complete_tab_ids
+    return parser_activate_tab
+
 
+def _add_active_tab_parser(subparsers):
     parser_active_tab = subparsers.add_parser(
         'active',
         help='Display active tab for each client/window in the following format: '
              '"<prefix>.<window_id>.<tab_id>"')
     parser_active_tab.set_defaults(func=show_active_tabs)
+    return parser_active_tab
 
+
+def _add_screenshot_parser(subparsers):
     parser_screenshot = subparsers.add_parser(
         'screenshot',
         help="Return base64 screenshot in json object with keys: 'data' (base64 png), "
@@ -952,7 +1040,11 @@ def build_parser():
                                    help='Output raw image bytes to stdout')
     parser_screenshot.add_argument('--wait', type=float, default=0,
                                    help='Wait time in seconds before taking the screenshot')
+    parser_screenshot_tab.completer = complete_tab_ids
+    return parser_screenshot
 
+
+def _add_search_tabs_parser(subparsers):
     parser_search_tabs = subparsers.add_parser(
         'search',
         help='Search across your indexed tabs using sqlite fts5 plugin.')
@@ -960,7 +1052,10 @@ def build_parser():
     parser_search_tabs.add_argument('--sqlite', type=str, default=in_temp_dir('tabs.sqlite'),
                                     help='sqlite DB filename')
     parser_search_tabs.add_argument('query', type=str, help='Search query')
+    return parser_search_tabs
+
 
+def _add_query_tabs_parser(subparsers):
     parser_query_tabs = subparsers.add_parser(
         'query',
         help='Filter tabs using chrome.tabs api.',
@@ -1021,7 +1116,10 @@ def build_parser():
     parser_query_tabs.add_argument('-info', type=str,
                                    help='the queryInfo parameter as outlined here: https://developer.chrome.com/extensions/tabs#method-query. '
                                         'All other query arguments are ignored if this argument is present.')
+    return parser_query_tabs
 
+
+def _add_index_tabs_parser(subparsers):
     parser_index_tabs = subparsers.add_parser(
         'index',
         help="Index the text from browser's tabs. Text is put into sqlite fts5 table.")
@@ -1031,14 +1129,19 @@ def build_parser():
     parser_index_tabs.add_argument('--sqlite', type=str, default=in_temp_dir('tabs.sqlite'),
                                    help='sqlite DB filename')
     parser_index_tabs.add_argument('--tsv', type=str, default=None,
-                                   help='get text from tabs and index the results')
+                                   help='index the text from this tsv file (as written by the text command) '
+                                        'instead of getting it from tabs')
     parser_index_tabs.add_argument(
         '--delimiter-regex', type=str, default=DEFAULT_GET_TEXT_DELIMITER_REGEX,
         help='Regex that is used to match delimiters in the page text')
     parser_index_tabs.add_argument(
         '--replace-with', type=str, default=DEFAULT_GET_TEXT_REPLACE_WITH,
         help='String that is used to replaced matched delimiters')
+    parser_index_tabs_ids.completer = complete_tab_ids
+    return parser_index_tabs
+
 
+def _add_new_tab_parser(subparsers):
     parser_new_tab = subparsers.add_parser(
         'new',
         help='Open new tab with the Google search results of the arguments that follow. '
@@ -1050,7 +1153,11 @@ def build_parser():
         help='Client prefix and (optionally) window id, e.g. b.20')
     parser_new_tab.add_argument('query', type=str, nargs='*',
                                 help='Query to search for in Google')
+    parser_new_tab_target.completer = complete_client_or_window
+    return parser_new_tab
+
 
+def _add_open_urls_parser(subparsers):
     parser_open_urls = subparsers.add_parser(
         'open',
         help='Open URLs from arguments or stdin (one URL per line). The optional '
@@ -1061,7 +1168,11 @@ def build_parser():
     parser_open_urls.set_defaults(func=open_urls)
     parser_open_urls_args = parser_open_urls.add_argument('open_args', type=str, nargs='*',
                                                           help='Optional client/window followed by URLs')
+    parser_open_urls_args.completer = complete_open_args
+    return parser_open_urls
+
 
+def _add_navigate_urls_parser(subparsers):
     parser_navigate_urls = subparsers.add_parser(
         'navigate',
         help='Navigate to URLs. There are two ways to specify tab ids and URLs: '
@@ -1071,7 +1182,11 @@ def build_parser():
     parser_navigate_urls.set_defaults(func=navigate_urls)
     parser_navigate_urls_tab = parser_navigate_urls.add_argument('tab_id', type=str, help='Tab id e.g. b.20.130')
     parser_navigate_urls.add_argument('url', type=str, help='URL to navigate to')
+    parser_navigate_urls_tab.completer = complete_tab_ids
+    return parser_navigate_urls
+
 
+def _add_update_tabs_parser(subparsers):
     parser_update_tabs = subparsers.add_parser(
         'update',
         help='Update tabs state, e.g. URL. There are two ways to specify updates: '
@@ -1112,7 +1227,11 @@ def build_parser():
                                     help='JSON in the following format: '
                                          'bruvtab update -info \'[{"tab_id": "b.20.130", "properties": {"url": "http://www.google.com"}}]\'. '
                                          'All other update arguments are ignored if this argument is present.')
+    parser_update_tabs_tab.completer = complete_tab_ids
+    return parser_update_tabs
+
 
+def _add_get_words_parser(subparsers):
     parser_get_words = subparsers.add_parser(
         'words',
         help='Show sorted unique words from all active tabs of all clients or from '
@@ -1127,7 +1246,11 @@ def build_parser():
     parser_get_words.add_argument(
         '--join-with', type=str, default=DEFAULT_GET_WORDS_JOIN_WITH,
         help='String that is used to join matched words')
+    parser_get_words_ids.completer = complete_tab_ids
+    return parser_get_words
+
 
+def _add_get_text_parser(subparsers):
     parser_get_text = subparsers.add_parser(
         'text',
         help='Show text from all tabs or from specified tabs')
@@ -1145,7 +1268,11 @@ def build_parser():
     parser_get_text.add_argument(
         '--replace-with', type=str, default=DEFAULT_GET_TEXT_REPLACE_WITH,
         help='String that is used to replaced matched delimiters')
+    parser_get_text_ids.completer = complete_tab_ids
+    return parser_get_text
+
 
+def _add_get_html_parser(subparsers):
     parser_get_html = subparsers.add_parser(
         'html',
         help='Show html from all tabs or from specified tabs')
@@ -1163,23 +1290,43 @@ def build_parser():
     parser_get_html.add_argument(
         '--replace-with', type=str, default=DEFAULT_GET_HTML_REPLACE_WITH,
         help='String that is used to replaced matched delimiters')
+    parser_get_html_ids.completer = complete_tab_ids
+    return parser_get_html
+
 
+def _add_show_duplicates_parser(subparsers):
     parser_show_duplicates = subparsers.add_parser(
         'dup',
-        help='Display reminder on how to show duplicate tabs using command-line tools')
-    parser_show_duplicates.set_defaults(func=show_duplicates)
-
+        help='Display duplicate tabs, i.e. tabs with the same URL (or title) as '
+             'one of the tabs listed before them. The first tab of every group '
+             'is not displayed, so the output can be piped into "bruvtab close"')
+    parser_show_duplicates.set_defaults(func=show_duplicates, **DUPLICATE_DEFAULTS)
+    parser_show_duplicates.add_argument('--by', choices=sorted(DUPLICATE_KEY_COLUMNS),
+                                        help='Tab field used to detect duplicates (default: %s)'
+                                             % DUPLICATE_DEFAULTS['by'])
+    parser_show_duplicates.add_argument('--close', action='store_true',
+                                        help='Close duplicate tabs instead of displaying them')
+    return parser_show_duplicates
+
+
+def _add_show_windows_parser(subparsers):
     parser_show_windows = subparsers.add_parser(
         'windows',
         help='Display available prefixes and window IDs, along with the number of tabs in every window')
     parser_show_windows.set_defaults(func=show_windows)
+    return parser_show_windows
+
 
+def _add_show_clients_parser(subparsers):
     parser_show_clients = subparsers.add_parser(
         'clients',
         help='Display available browser clients (mediators), their prefixes and address (host:port), '
              'native app PIDs, and browser names')
     parser_show_clients.set_defaults(func=show_clients)
+    return parser_show_clients
+
 
+def _add_install_mediator_parser(subparsers):
     parser_install_mediator = subparsers.add_parser(
         'install',
         help='Configure browser settings to use bruvtab mediator (native messaging app)')
@@ -1193,6 +1340,57 @@ def build_parser():
                                          help='install testing version of '
                                               'manifest for chromium')
     parser_install_mediator.set_defaults(func=install_mediator)
+    return parser_install_mediator
+
+
+SUBCOMMAND_PARSERS = {
+    'move': _add_move_tabs_parser,
+    'list': _add_list_tabs_parser,
+    'tabs': _add_list_tabs_parser,
+    'close': _add_close_tabs_parser,
+    'activate': _add_activate_tab_parser,
+    'active': _add_active_tab_parser,
+    'screenshot': _add_screenshot_parser,
+    'search': _add_search_tabs_parser,
+    'query': _add_query_tabs_parser,
+    'index': _add_index_tabs_parser,
+    'new': _add_new_tab_parser,
+    'open': _add_open_urls_parser,
+    'navigate': _add_navigate_urls_parser,
+    'update': _add_update_tabs_parser,
+    'words': _add_get_words_parser,
+    'text': _add_get_text_parser,
+    'html': _add_get_html_parser,
+    'dup': _add_show_duplicates_parser,
+    'windows': _add_show_windows_parser,
+    'clients': _add_show_clients_parser,
+    'install': _add_install_mediator_parser,
+}
+
+
+def build_parser(command=None):
+    """
+    Build the command-line parser. When command is given, only the
+    subparser of that command is added, which is much cheaper than building
+    all of them. Help, completion and errors need the full parser.
+    """
+    parser = ArgumentParser(
+        formatter_class=make_help_formatter,
+        description='bruvtab (bruvtab = Browser Tabs) is a command-line tool that helps you manage '
+                    'browser tabs. It can help you list, close, reorder, open and activate '
+                    'your tabs.')
+
+    parser_client = add_global_arguments(parser)
+
+    subparsers = parser.add_subparsers(dest='command')
+    parser.set_defaults(func=partial(no_command, parser))
+
+    if command is None:
+        add_parsers = list(dict.fromkeys(SUBCOMMAND_PARSERS.values()))
+    else:
+        add_parsers = [SUBCOMMAND_PARSERS[command]]
+    for add_parser in add_parsers:
+        add_parser(subparsers)
 
     subparser_clients = []
     seen_subparsers = set()
@@ -1204,35 +1402,82 @@ def build_parser():
 
     for client_action in [parser_client] + subparser_clients:
         client_action.completer = complete_clients
-    parser_close_tabs_ids.completer = complete_tab_ids
-    parser_activate_tab_id.completer = complete_tab_ids
-    parser_screenshot_tab.completer = complete_tab_ids
-    parser_index_tabs_ids.completer = complete_tab_ids
-    parser_new_tab_target.completer = complete_client_or_window
-    parser_open_urls_args.completer = complete_open_args
-    parser_navigate_urls_tab.completer = complete_tab_ids
-    parser_update_tabs_tab.completer = complete_tab_ids
-    parser_get_words_ids.completer = complete_tab_ids
-    parser_get_text_ids.completer = complete_tab_ids
-    parser_get_html_ids.completer = complete_tab_ids
 
     return parser
 
 
+# Global options that take a value, after normalize_global_args
+GLOBAL_OPTIONS_WITH_VALUE = ('--target', '--client')
+
+
+def find_command(args):
+    """
+    Return the subcommand of already normalized arguments, or None when
+    there is no (known) subcommand or help has been requested.
+    """
+    index = 0
+    while index < len(args):
+        arg = args[index]
+        if arg in ('-h', '--help'):
+            return None
+        if arg in GLOBAL_OPTIONS_WITH_VALUE:
+            index += 2
+            continue
+        if arg.startswith('-'):
+            index += 1
+            continue
+        return arg if arg in SUBCOMMAND_PARSERS else None
+    return None
+
+
+# Commands that are often run without any arguments, mapped to their handler
+# and the defaults their subparser would set. Parsing such invocations
+# skips argparse completely.
+FAST_COMMANDS = {
+    'list': (list_tabs, {'selectors': []}),
+    'tabs': (list_tabs, {'selectors': []}),
+    'active': (show_active_tabs, {}),
+    'windows': (show_windows, {}),
+    'clients': (show_clients, {}),
+    'dup': (show_duplicates, DUPLICATE_DEFAULTS),
+}
+
+
+def parse_fast_command(args):
+    """
+    Return parsed arguments for a lone fast command, e.g. "bruvtab list",
+    or None if args need the real parser.
+    """
+    if len(args) != 1 or args[0] not in FAST_COMMANDS or '_ARGCOMPLETE' in os.environ:
+        return None
+    command = args[0]
+    func, defaults = FAST_COMMANDS[command]
+    return Namespace(target_hosts=None, client_selector=None, json=False, no_wrap=False,
+                     command=command, func=func, **defaults)
+
+
 def parse_args(args):
-    parser = build_parser()
-    argcomplete.autocomplete(parser, validator=completion_validator)
+    fast_args = parse_fast_command(args)
+    if fast_args is not None:
+        return fast_args
     args = normalize_global_args(args)
+    # argcomplete completes against the full parser
+    command = None if '_ARGCOMPLETE' in os.environ else find_command(args)
+    parser = build_parser(command)
+    argcomplete.autocomplete(parser, validator=completion_validator)
     return parser.parse_args(args)
 
 
 def run_commands(args):
+    reset_clients_cache()
     args = parse_args(args)
     result = 0
     try:
         result = args.func(args)
     except BrokenPipeError:
         pass
+    finally:
+        reset_clients_cache()
     return result
 
 
@@ -1,3 +1,4 @@
+import logging
 import os
 from json import loads
 from threading import Thread
@@ -113,9 +114,13 @@ class MediatorHttpServer:
         if urls is None:
             return 'ERROR: Please provide urls file in the request'
         urls = urls.stream.read().decode('utf8').splitlines()
-        mediator_logger.info('Open urls (window_id = %s): %s', window_id, urls)
+        mediator_logger.info('Open %s urls (window_id = %s)', len(urls), window_id)
+        if mediator_logger.isEnabledFor(logging.DEBUG):
+            mediator_logger.debug('Open urls (window_id = %s): %s', window_id, urls)
         result = self.remote_api.open_urls(urls, window_id)
-        mediator_logger.info('Open urls result: %s', str(result))
+        mediator_logger.info('Open urls result: %s tabs', len(result))
+        if mediator_logger.isEnabledFor(logging.DEBUG):
+            mediator_logger.debug('Open urls result: %s', result)
         return '\n'.join(result)
 
     def update_tabs(self):
@@ -123,9 +128,13 @@ class MediatorHttpServer:
         if updates is None:
             return 'ERROR: Please provide updates in the request'
         updates = loads(updates.stream.read().decode('utf8'))
-        mediator_logger.info('Sending tab updates: %s', updates)
+        mediator_logger.info('Sending %s tab updates', len(updates))
+        if mediator_logger.isEnabledFor(logging.DEBUG):
+            mediator_logger.debug('Sending tab updates: %s', updates)
         result = self.remote_api.update_tabs(updates)
-        mediator_logger.info('Update tabs result: %s', str(result))
+        mediator_logger.info('Update tabs result: %s tabs', len(result))
+        if mediator_logger.isEnabledFor(logging.DEBUG):
+            mediator_logger.debug('Update tabs result: %s', result)
         return '\n'.join(result)
 
     def close_tabs(self, tab_ids):
@@ -155,8 +164,10 @@ class MediatorHttpServer:
         words = self.remote_api.get_words(tab_id,
                                           decode_query(match_regex),
                                           decode_query(join_with))
-        mediator_logger.info('words for tab_id %s (match_regex %s, join_with %s): %s',
-                             tab_id, match_regex, join_with, words)
+        mediator_logger.info('%s words for tab_id %s (match_regex %s, join_with %s)',
+                             len(words), tab_id, match_regex, join_with)
+        if mediator_logger.isEnabledFor(logging.DEBUG):
+            mediator_logger.debug('words for tab_id %s: %s', tab_id, words)
         return '\n'.join(words)
 
     def get_text(self):
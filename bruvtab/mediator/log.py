@@ -1,34 +1,46 @@
+import atexit
 import logging
 import logging.handlers
+from os import environ
+from queue import SimpleQueue
 from traceback import format_stack
 
 from bruvtab.files import in_temp_dir
 
 
-def _init_logger(tag, filename: str):
+LOG_LEVEL = environ.get('BRUVTAB_LOG_LEVEL', 'INFO').upper()
+
+
+def _file_handler(filename: str):
     FORMAT = '%(asctime)-15s %(process)-5d %(levelname)-8s %(filename)s:%(lineno)d:%(funcName)s %(message)s'
     MAX_LOG_SIZE = 50 * 1024 * 1024
     LOG_BACKUP_COUNT = 1
 
-    log = logging.getLogger('bruvtab')
-    log.setLevel(logging.DEBUG)
     handler = logging.handlers.RotatingFileHandler(
         filename=filename,
         maxBytes=MAX_LOG_SIZE,
         backupCount=LOG_BACKUP_COUNT,
     )
     handler.setFormatter(logging.Formatter(FORMAT))
-    log.addHandler(handler)
-    log.info('Logger has been created (%s)', tag)
-    return log
+    return handler
 
 
-def init_bruvtab_logger(tag: str):
-    return _init_logger(tag, in_temp_dir('bruvtab.log'))
-
-
-def init_mediator_logger(tag: str):
-    return _init_logger(tag, in_temp_dir('bruvtab_mediator.log'))
+def _init_logger(filenames):
+    log = logging.getLogger('bruvtab')
+    level = logging.getLevelName(LOG_LEVEL)
+    log.setLevel(level if isinstance(level, int) else logging.INFO)
+    # Records are written to all the files by a single background thread, so
+    # callers do not wait for disk writes and log rotation.
+    queue = SimpleQueue()
+    listener = logging.handlers.QueueListener(
+        queue, *[_file_handler(filename) for filename in filenames])
+    listener.start()
+    atexit.register(listener.stop)
+    log.addHandler(logging.handlers.QueueHandler(queue))
+    if not isinstance(level, int):
+        log.warning('Unknown BRUVTAB_LOG_LEVEL %s, using INFO', LOG_LEVEL)
+    log.info('Logger has been created')
+    return log
 
 
 def disable_logging():
@@ -60,5 +72,6 @@ def stack():
     return '\n'.join(format_stack())
 
 
-mediator_logger = init_mediator_logger('mediator')
-bruvtab_logger = init_bruvtab_logger('bruvtab')
+# bruvtab and the mediator log with the same 'bruvtab' logger, into both files
+mediator_logger = _init_logger([in_temp_dir('bruvtab_mediator.log'), in_temp_dir('bruvtab.log')])
+bruvtab_logger = mediator_logger
@@ -1,3 +1,4 @@
+import logging
 from typing import List
 from urllib.parse import quote_plus
 
@@ -45,7 +46,9 @@ class BrowserRemoteAPI:
 
         If window_id is None, currently active window is used.
         """
-        mediator_logger.info('open urls: %s', urls)
+        mediator_logger.info('open %s urls', len(urls))
+        if mediator_logger.isEnabledFor(logging.DEBUG):
+            mediator_logger.debug('open urls: %s', urls)
 
         command = {'name': 'open_urls', 'urls': urls}
         if window_id is not None:
@@ -64,7 +67,9 @@ class BrowserRemoteAPI:
         } ]
         see https://developer.mozilla.org/en-US/docs/Mozilla/Add-ons/WebExtensions/API/tabs/update
         """
-        mediator_logger.info('update tabs: %s', updates)
+        mediator_logger.info('update %s tabs', len(updates))
+        if mediator_logger.isEnabledFor(logging.DEBUG):
+            mediator_logger.debug('update tabs: %s', updates)
         command = {'name': 'update_tabs', 'updates': updates}
         self._transport.send(command)
         return self._transport.recv()
@@ -1,4 +1,5 @@
 import json
+import logging
 import struct
 import sys
 from abc import ABC
@@ -48,11 +49,14 @@ class StdTransport(Transport):
 
     def send(self, command: dict) -> None:
         encoded = self._encode(command)
-        mediator_logger.info('StdTransport SENDING: %s', command)
+        mediator_logger.info('StdTransport SENDING: %s, %s bytes',
+                             command.get('name'), len(encoded['content']))
+        if mediator_logger.isEnabledFor(logging.DEBUG):
+            mediator_logger.debug('StdTransport SENDING: %s', command)
         self._out.write(encoded['length'])
         self._out.write(encoded['content'])
         self._out.flush()
-        mediator_logger.info('StdTransport SENDING DONE: %s', command)
+        mediator_logger.info('StdTransport SENDING DONE: %s', command.get('name'))
 
     def recv(self) -> dict:
         mediator_logger.info('StdTransport RECEIVING')
@@ -60,8 +64,11 @@ class StdTransport(Transport):
         if len(raw_length) == 0:
             raise TransportError('StdTransport: cannot read, raw_length is empty')
         message_length = struct.unpack('@I', raw_length)[0]
-        message = self._in.read(message_length).decode('utf8')
-        mediator_logger.info('StdTransport RECEIVED: %s', message.encode('utf8'))
+        # json.loads decodes utf-8 bytes itself, no need to build a str first
+        message = self._in.read(message_length)
+        mediator_logger.info('StdTransport RECEIVED: %s bytes', message_length)
+        if mediator_logger.isEnabledFor(logging.DEBUG):
+            mediator_logger.debug('StdTransport RECEIVED: %s', message)
         return json.loads(message)
 
     def _encode(self, message):
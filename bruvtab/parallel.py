@@ -1,5 +1,6 @@
 import asyncio
 from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import as_completed
 
 
 def call_parallel(functions):
@@ -28,3 +29,22 @@ def call_parallel(functions):
         executor.shutdown(wait=True)
 
     return result
+
+
+def iter_parallel(functions, ordered=False):
+    """
+    Call functions in multiple threads and yield their results as soon as
+    each of them completes (not in the order of functions).
+
+    With ordered=True the results are yielded in the order of functions,
+    each one as soon as it and all functions before it have completed.
+
+    Functions should accept no parameters (wrap then with partial or lambda).
+    """
+    if not functions:
+        return
+
+    with ThreadPoolExecutor(max_workers=len(functions)) as executor:
+        futures = [executor.submit(function) for function in functions]
+        for future in (futures if ordered else as_completed(futures)):
+            yield future.result()
@@ -23,20 +23,37 @@ def index(sqlite_filename, tsv_filename):
     csv.field_size_limit(int(ctypes.c_ulong(-1).value // 2))
 
     with open(tsv_filename, encoding='utf-8') as tsv_file:
-        lines = [tuple(line) for line in csv.reader(tsv_file, delimiter='\t',
-                                                    quoting=csv.QUOTE_NONE)]
+        rows = (tuple(line) for line in csv.reader(tsv_file, delimiter='\t',
+                                                   quoting=csv.QUOTE_NONE))
+        index_rows(sqlite_filename, rows)
 
-    logger.info(
-        'Creating sqlite DB filename %s from tsv %s (%s lines)',
-        sqlite_filename, tsv_filename, len(lines))
+
+def index_rows(sqlite_filename, rows):
+    """
+    Create sqlite DB with the full-text index of rows, where every row is a
+    (tab_id, title, url, body) tuple. rows can be any iterable, it is
+    consumed as it is inserted.
+    """
+    logger.info('Creating sqlite DB filename %s', sqlite_filename)
     conn = sqlite3.connect(sqlite_filename)
     cursor = conn.cursor()
+    # The index is rebuilt from scratch every time, durability is not needed
+    # while it is being filled.
+    cursor.execute('pragma journal_mode=memory;')
+    cursor.execute('pragma synchronous=off;')
     with suppress(sqlite3.OperationalError):
         cursor.execute('drop table tabs;')
+    # tab_id is only ever displayed, not searched, so it is not tokenized.
     cursor.execute(
         'create virtual table tabs using fts5('
-        '    tab_id, title, url, body, tokenize="porter unicode61");')
-    cursor.executemany('insert into tabs values (?, ?, ?, ?)', lines)
+        '    tab_id unindexed, title, url, body, tokenize="porter unicode61");')
+    cursor.executemany('insert into tabs values (?, ?, ?, ?)', rows)
+    # rowcount, unlike conn.total_changes, does not include the writes FTS5
+    # makes to its shadow tables
+    logger.info('Inserted %s rows into %s', cursor.rowcount, sqlite_filename)
+    # Merge the b-trees written by the bulk insert into one: smaller file and
+    # faster queries.
+    cursor.execute("insert into tabs(tabs) values ('optimize');")
     conn.commit()
     conn.close()
 
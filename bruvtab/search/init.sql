@@ -1,3 +1,3 @@
-create virtual table tabs using fts5(tab_id, title, url, body);
+create virtual table tabs using fts5(tab_id unindexed, title, url, body, tokenize="porter unicode61");
 .mode tabs
 .import tabs.tsv tabs
@@ -1,9 +1,13 @@
 import os
+import socket
 from unittest import TestCase
 from unittest.mock import patch
 
+from bruvtab.inout import are_ports_accepting_connections
 from bruvtab.inout import edit_tabs_in_editor
+from bruvtab.inout import get_available_tcp_port
 from bruvtab.inout import TimeoutIO
+from bruvtab.inout import write_lines
 
 
 class TestEditor(TestCase):
@@ -47,3 +51,47 @@ class TestTimeoutIO(TestCase):
                 assert wrapped.read(4) == b'5678'
         finally:
             os.close(write_fd)
+
+
+class TestWriteLines(TestCase):
+    def test_write_lines_terminates_every_line(self):
+        output = []
+        with patch('bruvtab.inout.stdout_buffer_write', output.append):
+            write_lines(['a.1.1\ttitle\turl', 'a.1.2\tтитул\turl'])
+        assert output == ['a.1.1\ttitle\turl\na.1.2\tтитул\turl\n'.encode('utf-8')]
+
+    def test_write_lines_passes_bytes_through(self):
+        output = []
+        with patch('bruvtab.inout.stdout_buffer_write', output.append):
+            write_lines([b'a.1.1', 'a.1.2'])
+        assert output == [b'a.1.1\na.1.2\n']
+
+    def test_write_lines_flushes_every_flush_size_bytes(self):
+        output = []
+        with patch('bruvtab.inout.stdout_buffer_write', output.append):
+            write_lines(['aa', 'bb', 'cc'], flush_size=5)
+        assert output == [b'aa\nbb\n', b'cc\n']
+
+    def test_write_lines_empty(self):
+        output = []
+        with patch('bruvtab.inout.stdout_buffer_write', output.append):
+            write_lines([])
+        assert output == []
+
+
+class TestPortsAcceptingConnections(TestCase):
+    def test_only_listening_ports_are_accepting(self):
+        server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.addCleanup(server.close)
+        server.bind(('127.0.0.1', 0))
+        server.listen(1)
+        open_port = server.getsockname()[1]
+        closed_port = get_available_tcp_port(start=open_port + 1)
+
+        assert are_ports_accepting_connections([
+            ('127.0.0.1', closed_port),
+            ('localhost', open_port),
+        ]) == [False, True]
+
+    def test_no_addresses(self):
+        assert are_ports_accepting_connections([]) == []
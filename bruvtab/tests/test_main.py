@@ -1,3 +1,4 @@
+import os
 from argparse import Namespace
 from io import StringIO
 from string import ascii_letters
@@ -23,12 +24,17 @@ from bruvtab.main import complete_client_or_window
 from bruvtab.main import complete_open_args
 from bruvtab.main import complete_tab_ids
 from bruvtab.main import completion_validator
+from bruvtab.main import FAST_COMMANDS
+from bruvtab.main import find_command
 from bruvtab.main import parse_args
+from bruvtab.main import parse_fast_command
 from bruvtab.main import print_json
+from bruvtab.main import reset_clients_cache
 from bruvtab.main import run_commands
 from bruvtab.mediator.http_server import MediatorHttpServer
 from bruvtab.mediator.remote_api import default_remote_api
 from bruvtab.mediator.transport import Transport
+from bruvtab.search.index import index_rows
 from bruvtab.tests.utils import assert_file_absent
 from bruvtab.tests.utils import assert_file_contents
 from bruvtab.tests.utils import assert_file_not_empty
@@ -182,6 +188,7 @@ class WithMediator(TestCase):
         self.mediator = MockedMediator('a')
 
     def tearDown(self):
+        reset_clients_cache()
         self.mediator.join()
 
     def _run_commands(self, commands):
@@ -239,6 +246,16 @@ class TestCreateClients(WithMediator):
         assert 1 == len(clients)
         assert clients[0]._prefix == 'b.'
 
+    def test_clients_are_probed_once_per_command(self):
+        with patch('bruvtab.main.get_mediator_ports') as mocked:
+            mocked.side_effect = [range(self.mediator.port, self.mediator.port + 1)]
+            first = create_clients()
+            second = create_clients()
+            filtered = create_clients(client_selector='b')
+        assert first == second
+        assert filtered == []
+        assert 1 == mocked.call_count
+
 
 class TestActivate(WithMediator):
     def test_activate_ok(self):
@@ -264,7 +281,7 @@ class TestText(WithMediator):
         ])
 
         output = []
-        with patch('bruvtab.main.stdout_buffer_write', output.append):
+        with patch('bruvtab.inout.stdout_buffer_write', output.append):
             self._run_commands(['text'])
         self._assert_init()
         assert self.mediator.transport.sent == [
@@ -279,7 +296,7 @@ class TestText(WithMediator):
         ])
 
         output = []
-        with patch('bruvtab.main.stdout_buffer_write', output.append):
+        with patch('bruvtab.inout.stdout_buffer_write', output.append):
             self._run_commands(['text', 'a.1.2'])
         self._assert_init()
         assert self.mediator.transport.sent == [
@@ -303,7 +320,7 @@ class TestText(WithMediator):
         ])
 
         output = []
-        with patch('bruvtab.main.stdout_buffer_write', output.append):
+        with patch('bruvtab.inout.stdout_buffer_write', output.append):
             self._run_commands(['text', 'a.1.2', 'a.1.3'])
         self._assert_init()
         assert self.mediator.transport.sent == [
@@ -311,6 +328,18 @@ class TestText(WithMediator):
         ]
         assert output == [b'a.1.2\ttitle\turl\tbody\na.1.3\ttitle\turl\tbody\n']
 
+    def test_text_cleanup_collapses_whitespace(self):
+        self.mediator.transport.received_extend([
+            'mocked',
+            ['1.1\ttitle\turl\t  some    body  text  '],
+        ])
+
+        output = []
+        with patch('bruvtab.inout.stdout_buffer_write', output.append):
+            self._run_commands(['text', '--cleanup'])
+        self._assert_init()
+        assert output == [b'a.1.1\ttitle\turl\tsome body text\n']
+
 
 class TestHtml(WithMediator):
     def test_html_no_arguments_ok(self):
@@ -320,7 +349,7 @@ class TestHtml(WithMediator):
         ])
 
         output = []
-        with patch('bruvtab.main.stdout_buffer_write', output.append):
+        with patch('bruvtab.inout.stdout_buffer_write', output.append):
             self._run_commands(['html'])
         self._assert_init()
         assert self.mediator.transport.sent == [
@@ -335,7 +364,7 @@ class TestHtml(WithMediator):
         ])
 
         output = []
-        with patch('bruvtab.main.stdout_buffer_write', output.append):
+        with patch('bruvtab.inout.stdout_buffer_write', output.append):
             self._run_commands(['html', 'a.1.2'])
         self._assert_init()
         assert self.mediator.transport.sent == [
@@ -359,7 +388,7 @@ class TestHtml(WithMediator):
         ])
 
         output = []
-        with patch('bruvtab.main.stdout_buffer_write', output.append):
+        with patch('bruvtab.inout.stdout_buffer_write', output.append):
             self._run_commands(['html', 'a.1.2', 'a.1.3'])
         self._assert_init()
         assert self.mediator.transport.sent == [
@@ -378,7 +407,7 @@ class TestHtml(WithMediator):
         ])
 
         output = []
-        with patch('bruvtab.main.stdout_buffer_write', output.append):
+        with patch('bruvtab.inout.stdout_buffer_write', output.append):
             self._run_commands(['html', 'google.com'])
         self._assert_init()
         assert self.mediator.transport.sent == [
@@ -400,7 +429,8 @@ class TestWords(WithMediator):
             ['word-a', 'word-b'],
         ])
 
-        with patch('builtins.print') as mocked:
+        output = []
+        with patch('bruvtab.inout.stdout_buffer_write', output.append):
             self._run_commands(['words', 'a.1.2'])
 
         self._assert_init()
@@ -412,7 +442,7 @@ class TestWords(WithMediator):
                 'tab_id': 2,
             },
         ]
-        mocked.assert_called_once_with('word-a\nword-b')
+        assert output == [b'word-a\nword-b\n']
 
 
 class TestIndex(WithMediator):
@@ -435,8 +465,7 @@ class TestIndex(WithMediator):
              'name': 'get_text', 'replace_with': '" "'},
         ]
         assert_file_not_empty(sqlite_filename)
-        assert_file_not_empty(tsv_filename)
-        assert_file_contents(tsv_filename, 'a.1.1\ttitle\turl\tbody\n')
+        assert not os.path.exists(tsv_filename)
         assert_sqlite3_table_contents(
             sqlite_filename, 'tabs', 'a.1.1\ttitle\turl\tbody')
 
@@ -466,6 +495,32 @@ class TestIndex(WithMediator):
         assert_file_absent(tsv_filename)
 
 
+class TestSearch(TestCase):
+    def test_search_finds_stemmed_words_in_indexed_text(self):
+        sqlite_filename = in_temp_dir(uuid4().hex + '.sqlite')
+        tsv_filename = in_temp_dir(uuid4().hex + '.tsv')
+        self.addCleanup(assert_file_absent, sqlite_filename)
+        self.addCleanup(assert_file_absent, tsv_filename)
+        spit(tsv_filename,
+             'a.1.1\tCats\thttps://cats.com\tcats are running around\n'
+             'a.1.2\tDogs\thttps://dogs.com\tdogs are sleeping\n')
+        run_commands(['index', '--sqlite', sqlite_filename, '--tsv', tsv_filename])
+
+        with patch('builtins.print') as mocked:
+            run_commands(['search', '--sqlite', sqlite_filename, 'run'])
+
+        mocked.assert_called_once_with('a.1.1\tCats\tcats are <b>running</b> around')
+
+    def test_index_logs_number_of_inserted_rows(self):
+        sqlite_filename = in_temp_dir(uuid4().hex + '.sqlite')
+        self.addCleanup(assert_file_absent, sqlite_filename)
+        rows = [('a.1.%d' % i, 'title', 'url', 'body') for i in range(10)]
+        with self.assertLogs('bruvtab', level='INFO') as logs:
+            index_rows(sqlite_filename, iter(rows))
+
+        assert 'Inserted 10 rows into %s' % sqlite_filename in '\n'.join(logs.output)
+
+
 class TestOpen(WithMediator):
     def test_one_url_without_client_ok(self):
         self.mediator.transport.received_extend([
@@ -568,6 +623,28 @@ class TestList(WithMediator):
             b'a.1.3\tMail\thttps://mail.google.com\n'
         ]
 
+    def test_tabs_with_and_without_selector_split_lines_alike(self):
+        for selectors in [[], ['url']]:
+            self.mediator.transport.received_extend([
+                'mocked',
+                ['1.1\tform\x0cfeed\u2028title\turl'],
+            ])
+
+            output = []
+            with patch('bruvtab.main.sys.stdout.buffer.write', output.append):
+                self._run_commands(['tabs'] + selectors)
+            assert output[-1:] == [
+                'a.1.1\tform\x0cfeed\u2028title\turl\n'.encode('utf8')]
+
+    def test_tabs_without_tabs_prints_nothing(self):
+        for selectors in [[], ['url']]:
+            self.mediator.transport.received_extend(['mocked', []])
+
+            output = []
+            with patch('bruvtab.main.sys.stdout.buffer.write', output.append):
+                self._run_commands(['tabs'] + selectors)
+            assert b''.join(output) == b''
+
     def test_tabs_json_filters_by_title_or_url(self):
         self.mediator.transport.received_extend([
             'mocked',
@@ -595,6 +672,69 @@ class TestList(WithMediator):
         )
 
 
+class TestDuplicates(WithMediator):
+    def _received_tabs(self):
+        self.mediator.transport.received_extend([
+            'mocked',
+            [
+                '1.1\tGoogle\thttps://google.com',
+                '1.2\tExample\thttps://example.com',
+                '1.3\tGoogle Search\thttps://google.com',
+                '1.4\tExample\thttps://example.org',
+            ],
+        ])
+
+    def test_dup_shows_url_duplicates(self):
+        self._received_tabs()
+
+        output = []
+        with patch('bruvtab.main.sys.stdout.buffer.write', output.append):
+            self._run_commands(['dup'])
+        self._assert_init()
+        assert self.mediator.transport.sent == [
+            {'name': 'list_tabs'},
+        ]
+        assert output[-1:] == [b'a.1.3\tGoogle Search\thttps://google.com\n']
+
+    def test_dup_shows_title_duplicates(self):
+        self._received_tabs()
+
+        output = []
+        with patch('bruvtab.main.sys.stdout.buffer.write', output.append):
+            self._run_commands(['dup', '--by', 'title'])
+        self._assert_init()
+        assert output[-1:] == [b'a.1.4\tExample\thttps://example.org\n']
+
+    def test_dup_close_closes_duplicates(self):
+        self._received_tabs()
+        self.mediator.transport.received_extend(['OK'])
+
+        self._run_commands(['dup', '--close'])
+        self._assert_init()
+        assert self.mediator.transport.sent == [
+            {'name': 'list_tabs'},
+            {'name': 'close_tabs', 'tab_ids': [3]},
+        ]
+
+
+class TestWindows(WithMediator):
+    def test_windows_counts_tabs_per_window(self):
+        self.mediator.transport.received_extend([
+            'mocked',
+            [
+                '10.1\ttitle\turl',
+                '2.2\ttitle\turl',
+                '10.3\ttitle\turl',
+            ],
+        ])
+
+        with patch('bruvtab.main.stdout_supports_rich', return_value=False):
+            with patch('builtins.print') as mocked:
+                self._run_commands(['windows'])
+        self._assert_init()
+        assert [c.args[0] for c in mocked.call_args_list] == ['a.10\t2', 'a.2\t1']
+
+
 class TestScreenshot(WithMediator):
     def test_raw_outputs_image_bytes(self):
         self.mediator.transport.received_extend([
@@ -762,6 +902,31 @@ class TestJsonOutput(TestCase):
         assert next(action for action in list_parser._actions if action.dest == 'client_selector').completer == complete_clients
 
 
+class TestParseArgs(TestCase):
+    def test_find_command_skips_global_arguments(self):
+        assert find_command(['--target', '127.0.0.1:4625', '--json', 'tabs', 'list']) == 'tabs'
+        assert find_command(['--client=firefox', 'open', 'url1']) == 'open'
+        assert find_command(['--json']) is None
+        assert find_command(['--help', 'list']) is None
+        assert find_command(['unknown']) is None
+
+    def test_build_parser_for_command_only_adds_its_subparser(self):
+        parser = build_parser('tabs')
+        subparsers = next(action for action in parser._actions if getattr(action, 'choices', None))
+
+        assert set(subparsers.choices) == {'list', 'tabs'}
+
+    def test_fast_commands_match_parser_defaults(self):
+        for command in FAST_COMMANDS:
+            expected = vars(build_parser().parse_args([command]))
+            assert vars(parse_args([command])) == expected, command
+
+    def test_fast_commands_with_arguments_use_parser(self):
+        assert parse_fast_command(['list', '--json']) is None
+        assert parse_fast_command(['list', 'google']) is None
+        assert parse_fast_command(['query']) is None
+
+
 class TestRichTableOutput(WithMediator):
     def _render_output(self, commands):
         buffer = StringIO()
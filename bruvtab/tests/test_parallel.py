@@ -0,0 +1,20 @@
+import time
+from unittest import TestCase
+
+from bruvtab.parallel import iter_parallel
+
+
+class TestIterParallel(TestCase):
+    def _functions(self):
+        def slow():
+            time.sleep(0.1)
+            return 'slow'
+
+        return [slow, lambda: 'fast']
+
+    def test_yields_results_as_they_complete(self):
+        self.assertEqual(['fast', 'slow'], list(iter_parallel(self._functions())))
+
+    def test_ordered_yields_results_in_order_of_functions(self):
+        self.assertEqual(['slow', 'fast'],
+                         list(iter_parallel(self._functions(), ordered=True)))